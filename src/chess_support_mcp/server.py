@@ -1,18 +1,30 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional
 
 import chess
 from mcp.server.fastmcp import FastMCP
+from mcp.types import ToolAnnotations
 
+# Side that plays a given ply, indexed by ply parity (0-based).
+_SIDES = ("white", "black")
 
-@dataclass
+
+@dataclass(slots=True)
 class GameState:
     """Holds a single in-memory chess game state."""
 
     board: chess.Board
     san_history: List[str]
+    # Append-only move records kept in step with board.move_stack.
+    uci_history: List[str] = field(default_factory=list)
+    detail_history: List[Dict[str, Any]] = field(default_factory=list)
+    # Derived views of the board, valid until the next push/reset.
+    _status_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _full_status_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False)
+    _pieces_cache: Optional[Dict[str, str]] = field(default=None, init=False, repr=False)
+    _ascii_cache: Optional[str] = field(default=None, init=False, repr=False)
 
     @classmethod
     def new(cls) -> "GameState":
@@ -21,6 +33,15 @@ class GameState:
     def reset(self) -> None:
         self.board.reset()
         self.san_history.clear()
+        self.uci_history.clear()
+        self.detail_history.clear()
+        self._invalidate()
+
+    def _invalidate(self) -> None:
+        self._status_cache = None
+        self._full_status_cache = None
+        self._pieces_cache = None
+        self._ascii_cache = None
 
     def add_move_uci(self, uci: str) -> Dict[str, Any]:
         try:
@@ -31,7 +52,7 @@ class GameState:
                 "reason": "parse_error",
                 "parse_error": str(exc),
             }
-        if move not in self.board.legal_moves:
+        if not self.board.is_legal(move):
             return {
                 "accepted": False,
                 "reason": "illegal",
@@ -39,7 +60,17 @@ class GameState:
             }
         san = self.board.san(move)
         self.board.push(move)
+        uci = move.uci()
+        ply = len(self.uci_history)
         self.san_history.append(san)
+        self.uci_history.append(uci)
+        self.detail_history.append({
+            "ply": ply + 1,
+            "uci": uci,
+            "san": san,
+            "side": _SIDES[ply & 1],
+        })
+        self._invalidate()
         return {"accepted": True}
 
     def is_move_legal(self, uci: str) -> Dict[str, Any]:
@@ -47,72 +78,73 @@ class GameState:
             move = chess.Move.from_uci(uci)
         except Exception as exc:  # noqa: BLE001
             return {"parse_error": str(exc), "legal": False}
-        return {"legal": move in self.board.legal_moves}
+        return {"legal": self.board.is_legal(move)}
 
+    # History accessors return the live lists; callers only read/serialize them.
     def all_moves(self) -> List[str]:
-        return [m.uci() for m in self.board.move_stack]
+        return self.uci_history
 
     def all_moves_detailed(self) -> List[Dict[str, Any]]:
-        details: List[Dict[str, Any]] = []
-        for idx, move in enumerate(self.board.move_stack):
-            details.append({
-                "ply": idx + 1,
-                "uci": move.uci(),
-                "san": self.san_history[idx] if idx < len(self.san_history) else None,
-                "side": "white" if idx % 2 == 0 else "black",
-            })
-        return details
+        return self.detail_history
 
     def last_n_moves(self, n: int) -> List[str]:
         if n <= 0:
             return []
-        return [m.uci() for m in self.board.move_stack[-n:]]
+        return self.uci_history[-n:]
 
     def last_n_moves_detailed(self, n: int) -> List[Dict[str, Any]]:
         if n <= 0:
             return []
-        start = max(0, len(self.board.move_stack) - n)
-        result: List[Dict[str, Any]] = []
-        for idx in range(start, len(self.board.move_stack)):
-            move = self.board.move_stack[idx]
-            result.append({
-                "ply": idx + 1,
-                "uci": move.uci(),
-                "san": self.san_history[idx] if idx < len(self.san_history) else None,
-                "side": "white" if idx % 2 == 0 else "black",
-            })
-        return result
+        return self.detail_history[-n:]
 
     def ascii_board(self) -> str:
-        return str(self.board)
+        if self._ascii_cache is None:
+            self._ascii_cache = str(self.board)
+        return self._ascii_cache
 
     def pieces_map(self) -> Dict[str, str]:
-        mapping: Dict[str, str] = {}
-        for square, piece in self.board.piece_map().items():
-            mapping[chess.square_name(square)] = piece.symbol()
+        if self._pieces_cache is not None:
+            return self._pieces_cache
+        names = chess.SQUARE_NAMES
+        symbols = chess.PIECE_SYMBOLS
+        mapping: Dict[str, str] = {
+            names[square]: symbols[piece.piece_type].upper() if piece.color else symbols[piece.piece_type]
+            for square, piece in self.board.piece_map().items()
+        }
+        self._pieces_cache = mapping
         return mapping
 
-    def status(self) -> Dict[str, Any]:
-        fen = self.board.fen()
-        parts = fen.split()
-        last_move_uci = self.board.move_stack[-1].uci() if self.board.move_stack else None
+    def status(self, include_pieces: bool = True) -> Dict[str, Any]:
+        if include_pieces:
+            if self._full_status_cache is None:
+                self._full_status_cache = {**self.status(include_pieces=False), "pieces": self.pieces_map()}
+            return self._full_status_cache
+        if self._status_cache is not None:
+            return self._status_cache
+        # Like the FEN field, only report the EP square when a legal en passant
+        # capture exists.
+        ep_square = self.board.ep_square if self.board.has_legal_en_passant() else None
+        last_move_uci = self.uci_history[-1] if self.uci_history else None
         last_move_san = self.san_history[-1] if self.san_history else None
-        return {
-            "fen": fen,
+        # Evaluated once; a finished game never depends on draw claims, so the
+        # repetition/fifty-move claim scan is not needed for the result.
+        outcome = self.board.outcome()
+        self._status_cache = {
+            "fen": self.board.fen(),
             "side_to_move": "white" if self.board.turn else "black",
             "fullmove_number": self.board.fullmove_number,
             "halfmove_clock": self.board.halfmove_clock,
             "ply_count": len(self.board.move_stack),
-            "castling_rights": parts[2] if len(parts) >= 3 else None,
-            "en_passant_square": parts[3] if len(parts) >= 4 else None,
+            "castling_rights": self.board.castling_xfen(),
+            "en_passant_square": chess.SQUARE_NAMES[ep_square] if ep_square is not None else "-",
             "last_move_uci": last_move_uci,
             "last_move_san": last_move_san,
-            "who_moved_last": ("white" if (len(self.board.move_stack) - 1) % 2 == 0 else "black") if self.board.move_stack else None,
+            "who_moved_last": _SIDES[(len(self.board.move_stack) - 1) & 1] if self.board.move_stack else None,
             "is_check": self.board.is_check(),
-            "is_game_over": self.board.is_game_over(),
-            "result": self.board.result(claim_draw=True) if self.board.is_game_over() else None,
-            "pieces": self.pieces_map(),
+            "is_game_over": outcome is not None,
+            "result": outcome.result() if outcome is not None else None,
         }
+        return self._status_cache
 
 
 server = FastMCP(
@@ -122,6 +154,18 @@ server = FastMCP(
 
 _GAME = GameState.new()
 
+# Tools that only read the game state.
+_READ_ONLY = ToolAnnotations(readOnlyHint=True)
+
+# The reset response is always the starting position, so build it once. It is
+# shared across calls and must not be mutated.
+_INITIAL_RESPONSE: Dict[str, Any] = {
+    "ok": True,
+    "status": GameState.new().status(),
+    "moves": [],
+    "moves_detailed": [],
+}
+
 
 @server.tool()
 def create_or_reset_game() -> Dict[str, Any]:
@@ -152,42 +196,40 @@ def create_or_reset_game() -> Dict[str, Any]:
     """
 
     _GAME.reset()
-    return {
-        "ok": True,
-        "status": _GAME.status(),
-        "moves": _GAME.all_moves(),
-        "moves_detailed": [
-            _format_move_detail(idx, move, _GAME.san_history)
-            for idx, move in enumerate(_GAME.board.move_stack)
-        ],
-    }
+    return _INITIAL_RESPONSE
 
 
-@server.tool()
-def get_status() -> Dict[str, Any]:
+@server.tool(annotations=_READ_ONLY)
+def get_status(include_pieces: bool = True) -> Dict[str, Any]:
     """Get current position metadata for model-friendly planning.
 
+    Parameters:
+    - include_pieces: set to false to omit the pieces map when only FEN/turn metadata is needed.
+
     Returns (in result):
     - fen, side_to_move, fullmove_number, halfmove_clock, ply_count
     - castling_rights, en_passant_square
     - last_move_uci, last_move_san, who_moved_last
     - is_check, is_game_over, result
-    - pieces: square-to-piece map (e.g., {"a2":"P", "e1":"K"})
+    - pieces: square-to-piece map (e.g., {"a2":"P", "e1":"K"}), unless include_pieces is false
     """
 
-    return _GAME.status()
+    return _GAME.status(include_pieces)
 
 
 @server.tool()
-def add_move(uci: str) -> Dict[str, Any]:
+def add_move(uci: str, include_pieces: bool = True, include_history: bool = False) -> Dict[str, Any]:
     """Apply a move in UCI format if legal.
 
     Parameters:
     - uci: string like "e2e4", "g1f3", promotions like "e7e8q".
+    - include_pieces: set to false to omit status.pieces from the response.
+    - include_history: set to true to also return the full move history on success.
 
     Returns (in result):
-    - On success: { accepted:true, status: Status, moves:[...], moves_detailed:[...] }
-      where Status is the same shape returned by get_status(), including last_move_{uci,san}.
+    - On success: { accepted:true, status: Status } where Status is the same shape returned
+      by get_status(), including last_move_{uci,san}. With include_history, also
+      moves:[...] and moves_detailed:[...] as returned by list_moves()/list_moves_detailed().
     - On failure: { accepted:false, reason:"illegal", expected_turn:"white"|"black", status: Status }
 
     Notes:
@@ -196,7 +238,8 @@ def add_move(uci: str) -> Dict[str, Any]:
 
     move_outcome = _GAME.add_move_uci(uci)
     response: Dict[str, Any] = {"accepted": bool(move_outcome.get("accepted"))}
-    response["status"] = _GAME.status()
+    # Rejected moves leave the board untouched, so this is the cached status.
+    response["status"] = _GAME.status(include_pieces)
     if not response["accepted"]:
         if "reason" in move_outcome:
             response["reason"] = move_outcome["reason"]
@@ -204,12 +247,13 @@ def add_move(uci: str) -> Dict[str, Any]:
             response["expected_turn"] = move_outcome["expected_turn"]
         return response
 
-    response["moves"] = _GAME.all_moves()
-    response["moves_detailed"] = _GAME.all_moves_detailed()
+    if include_history:
+        response["moves"] = _GAME.all_moves()
+        response["moves_detailed"] = _GAME.all_moves_detailed()
     return response
 
 
-@server.tool()
+@server.tool(annotations=_READ_ONLY)
 def is_legal(uci: str) -> Dict[str, Any]:
     """Check if a UCI move is legal in the current position.
 
@@ -221,36 +265,24 @@ def is_legal(uci: str) -> Dict[str, Any]:
     return _GAME.is_move_legal(uci)
 
 
-@server.tool()
+@server.tool(annotations=_READ_ONLY)
 def list_moves() -> List[str]:
     """Return all moves played so far in UCI, ordered from the start of the game."""
 
     return _GAME.all_moves()
 
 
-def _format_move_detail(idx: int, move: chess.Move, san_history: List[str]) -> Dict[str, Any]:
-    return {
-        "ply": idx + 1,
-        "uci": move.uci(),
-        "san": san_history[idx] if idx < len(san_history) else None,
-        "side": "white" if idx % 2 == 0 else "black",
-    }
-
-
-@server.tool()
+@server.tool(annotations=_READ_ONLY)
 def list_moves_detailed() -> List[Dict[str, Any]]:
     """Return detailed move history.
 
     Each item: { ply:int, side:"white"|"black", uci:string, san:string }
     """
 
-    return [
-        _format_move_detail(idx, move, _GAME.san_history)
-        for idx, move in enumerate(_GAME.board.move_stack)
-    ]
+    return _GAME.all_moves_detailed()
 
 
-@server.tool()
+@server.tool(annotations=_READ_ONLY)
 def last_moves(n: int = 1) -> List[str]:
     """Return the last N moves in UCI (default 1).
 
@@ -261,7 +293,7 @@ def last_moves(n: int = 1) -> List[str]:
     return _GAME.last_n_moves(n)
 
 
-@server.tool()
+@server.tool(annotations=_READ_ONLY)
 def last_moves_detailed(n: int = 1) -> List[Dict[str, Any]]:
     """Return the last N moves with details (default 1).
 
@@ -270,16 +302,10 @@ def last_moves_detailed(n: int = 1) -> List[Dict[str, Any]]:
     - n: integer >= 1. If n <= 0, returns an empty list.
     """
 
-    if n <= 0:
-        return []
-    start = max(0, len(_GAME.board.move_stack) - n)
-    return [
-        _format_move_detail(idx, _GAME.board.move_stack[idx], _GAME.san_history)
-        for idx in range(start, len(_GAME.board.move_stack))
-    ]
+    return _GAME.last_n_moves_detailed(n)
 
 
-@server.tool()
+@server.tool(annotations=_READ_ONLY)
 def board_ascii() -> str:
     """Return an ASCII representation of the board from White's perspective.
 
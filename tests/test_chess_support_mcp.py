@@ -38,6 +38,10 @@ async def test_reset_and_status():
         s2 = status2.structuredContent["result"]
         assert s2["side_to_move"] == "white"
 
+        light = await session.call_tool("get_status", {"include_pieces": False})
+        s3 = light.structuredContent["result"]
+        assert "pieces" not in s3 and s3["fen"] == s2["fen"]
+
 
 @pytest.mark.anyio
 async def test_add_move_and_list():
@@ -64,6 +68,7 @@ async def test_add_move_and_list():
         a3 = add3.structuredContent["result"]
         assert a3["accepted"] is True
         assert a3["status"]["last_move_san"] == "e5"
+        assert "moves" not in a3
 
         # History
         lm = await session.call_tool("list_moves", {})
@@ -79,6 +84,12 @@ async def test_add_move_and_list():
         last1d = await session.call_tool("last_moves_detailed", {"n": 1})
         assert last1d.structuredContent["result"][0]["uci"] == "e7e5"
 
+        # Full history is returned only on request
+        add4 = await session.call_tool("add_move", {"uci": "g1f3", "include_history": True})
+        a4 = add4.structuredContent["result"]
+        assert a4["moves"] == ["e2e4", "e7e5", "g1f3"]
+        assert a4["moves_detailed"][-1]["san"] == "Nf3"
+
 
 @pytest.mark.anyio
 async def test_legality_and_board_ascii():
@@ -86,6 +97,8 @@ async def test_legality_and_board_ascii():
         await session.call_tool("create_or_reset_game", {})
         legal = await session.call_tool("is_legal", {"uci": "e2e4"})
         assert legal.structuredContent["result"]["legal"] is True
+        illegal = await session.call_tool("is_legal", {"uci": "e2e5"})
+        assert illegal.structuredContent["result"]["legal"] is False
 
         board = await session.call_tool("board_ascii", {})
         assert isinstance(board.structuredContent["result"], str)